@@ -1,3 +1,5 @@
+import functools
+import re
 import urllib.parse
 
 from .common import InfoExtractor
@@ -7,7 +9,6 @@
     ExtractorError,
     determine_ext,
     filter_dict,
-    format_field,
     int_or_none,
     join_nonempty,
     parse_iso8601,
@@ -18,6 +19,36 @@
 )
 from ..utils.traversal import traverse_obj
 
+# meta['pre_title'] contains season and episode number for series in format "S<ID> E<ID>"
+_EPISODE_RE = re.compile(r'S(\d+)\s*E(\d+)')
+_SITE_VIDEO_ID_RE = re.compile(
+    r'(?:data-main-video\s*=|videoId["\']?\s*[:=])\s*(["\'])(?P<id>(?:(?!\1).)+)\1')
+_SITE_VIDEO_URL_RE = re.compile(
+    r'(?:href=|player\.setVideo\(\s*)"http://videos?\.francetv\.fr/video/([^@]+@[^"]+)"')
+_INFO_RE_PLAYER = re.compile(r'player\.load[^;]+src:\s*["\']([^"\']+)')
+_INFO_RE_IDVIDEO = re.compile(r'id-video=([^@]+@[^"]+)')
+_INFO_RE_HREF = re.compile(r'<a[^>]+href="(?:https?:)?//videos\.francetv\.fr/video/([^@]+@[^"]+)"')
+_INFO_RE_UUID = re.compile(
+    r'(?:data-id|<figure[^<]+\bid)=["\']([\da-f]{8}-[\da-f]{4}-[\da-f]{4}-[\da-f]{4}-[\da-f]{12})')
+# (literal that must be present for the pattern to match, pattern), in order of preference
+_INFO_VIDEO_ID_RES = (
+    ('player.load', _INFO_RE_PLAYER),
+    ('id-video=', _INFO_RE_IDVIDEO),
+    ('videos.francetv.fr/video/', _INFO_RE_HREF),
+    (None, _INFO_RE_UUID),
+)
+_PLAYER_URL_TEMPLATE = 'https://player.webservices.francetelevisions.fr/v1/videos/{}'
+_DEVICE_TYPES = ('desktop', 'mobile')
+# XXX: not entirely accurate; each spritesheet seems to be
+# a 10×10 grid of thumbnails corresponding to approximately
+# 2 seconds of the video; the last spritesheet may be shorter
+_SHEET_DURATION = 200
+_AUDIO_DESCRIPTION_LANGS = frozenset(('qtz', 'qad'))
+
+
+def _coalesce(cur, new):
+    return cur if cur is not None else new
+
 
 class FranceTVBaseInfoExtractor(InfoExtractor):
     def _make_url_result(self, video_or_full_id, catalog=None, url=None):
@@ -34,14 +65,14 @@ def _make_url_result(self, video_or_full_id, catalog=None, url=None):
 class FranceTVIE(InfoExtractor):
     _VALID_URL = r'''(?x)
                     (?:
-                        https?://
-                            sivideo\.webservices\.francetelevisions\.fr/tools/getInfosOeuvre/v2/\?
-                            .*?\bidDiffusion=[^&]+|
                         (?:
-                            https?://videos\.francetv\.fr/video/|
-                            francetv:
+                            francetv:|
+                            https?://videos\.francetv\.fr/video/
                         )
-                        (?P<id>[^@]+)(?:@(?P<catalog>.+))?
+                        (?P<id>[^@]+)(?:@(?P<catalog>.+))?|
+                        https?://
+                            sivideo\.webservices\.francetelevisions\.fr/tools/getInfosOeuvre/v2/\?
+                            .*?\bidDiffusion=[^&]+
                     )
                     '''
     _EMBED_REGEX = [r'<iframe[^>]+?src=(["\'])(?P<url>(?:https?://)?embed\.francetv\.fr/\?ue=.+?)\1']
@@ -82,12 +113,51 @@ class FranceTVIE(InfoExtractor):
     }, {
         'url': 'francetv:NI_657393@Regions',
         'only_matching': True,
+    }, {
+        # the id is everything up to the catalog separator
+        'url': 'francetv:NI_657393/extra@Regions',
+        'only_matching': True,
     }, {
         # france-3 live
         'url': 'francetv:SIM_France3',
         'only_matching': True,
     }]
 
+    @functools.cached_property
+    def _manifest_extractors(self):
+        # ext -> function(manifest_url, video_id, format_id) returning (formats, subtitles)
+        return {
+            'f4m': lambda url, video_id, format_id: (self._extract_f4m_formats(
+                url, video_id, f4m_id=format_id, fatal=False), {}),
+            'm3u8': lambda url, video_id, format_id: self._extract_m3u8_formats_and_subtitles(
+                url, video_id, 'mp4', entry_protocol='m3u8_native', m3u8_id=format_id, fatal=False),
+            'mpd': lambda url, video_id, format_id: self._extract_mpd_formats_and_subtitles(
+                url, video_id, mpd_id=format_id, fatal=False),
+        }
+
+    @classmethod
+    def _extract_embed_urls(cls, url, webpage):
+        # _EMBED_REGEX is run on every webpage the generic extractor sees;
+        # an embed cannot match without this literal
+        if 'embed.francetv.fr' in webpage:
+            yield from super()._extract_embed_urls(url, webpage)
+
+    def _download_player_info(self, player_url, video_id, hostname, device_type):
+        return self._download_json(
+            player_url, video_id, f'Downloading {device_type} video JSON', query=filter_dict({
+                'device_type': device_type,
+                'browser': 'chrome',
+                'domain': hostname,
+            }), fatal=False)
+
+    def _sign_video_url(self, video_id, format_id, token_url, video_url):
+        return traverse_obj(self._download_json(
+            token_url, video_id, f'Downloading signed {format_id} manifest URL',
+            fatal=False, query={
+                'format': 'json',
+                'url': video_url,
+            }), ('url', {url_or_none}))
+
     def _extract_video(self, video_id, catalogue=None, hostname=None):
         # TODO: Investigate/remove 'catalogue'/'catalog'; it has not been used since 2021
         is_live = None
@@ -101,86 +171,65 @@ def _extract_video(self, video_id, catalogue=None, hostname=None):
         timestamp = None
         spritesheets = None
 
-        for device_type in ('desktop', 'mobile'):
-            dinfo = self._download_json(
-                'https://player.webservices.francetelevisions.fr/v1/videos/%s' % video_id,
-                video_id, f'Downloading {device_type} video JSON', query=filter_dict({
-                    'device_type': device_type,
-                    'browser': 'chrome',
-                    'domain': hostname,
-                }), fatal=False)
-
-            if not dinfo:
+        player_url = _PLAYER_URL_TEMPLATE.format(video_id)
+        for device_type in _DEVICE_TYPES:
+            dinfo = self._download_player_info(player_url, video_id, hostname, device_type)
+            if not isinstance(dinfo, dict):
                 continue
 
-            video = traverse_obj(dinfo, ('video', {dict}))
-            if video:
-                videos.append(video)
-                if duration is None:
-                    duration = video.get('duration')
-                if is_live is None:
-                    is_live = video.get('is_live')
-                if spritesheets is None:
-                    spritesheets = video.get('spritesheets')
-
-            meta = traverse_obj(dinfo, ('meta', {dict}))
-            if meta:
-                if title is None:
-                    title = meta.get('title')
-                # meta['pre_title'] contains season and episode number for series in format "S<ID> E<ID>"
-                season_number, episode_number = self._search_regex(
-                    r'S(\d+)\s*E(\d+)', meta.get('pre_title'), 'episode info', group=(1, 2), default=(None, None))
-                if subtitle is None:
-                    subtitle = meta.get('additional_title')
-                if image is None:
-                    image = meta.get('image_url')
+            video = dinfo.get('video')
+            if video and isinstance(video, dict):
+                if url_or_none(video.get('url')):
+                    videos.append(video)
+                duration = _coalesce(duration, video.get('duration'))
+                is_live = _coalesce(is_live, video.get('is_live'))
+                spritesheets = _coalesce(spritesheets, video.get('spritesheets'))
+
+            meta = dinfo.get('meta')
+            if meta and isinstance(meta, dict):
+                title = _coalesce(title, meta.get('title'))
+                pre_title = meta.get('pre_title')
+                if episode_number is None and pre_title and isinstance(pre_title, str):
+                    mobj = _EPISODE_RE.search(pre_title)
+                    if mobj:
+                        season_number, episode_number = mobj.group(1, 2)
+                subtitle = _coalesce(subtitle, meta.get('additional_title'))
+                image = _coalesce(image, meta.get('image_url'))
                 if timestamp is None:
                     timestamp = parse_iso8601(meta.get('broadcasted_at'))
 
-        formats, subtitles, video_url = [], {}, None
-        for video in traverse_obj(videos, lambda _, v: url_or_none(v['url'])):
-            video_url = video['url']
-            format_id = video.get('format')
-
+        def token_key(video):
             token_url = url_or_none(video.get('token'))
             if token_url and video.get('workflow') == 'token-akamai':
-                tokenized_url = traverse_obj(self._download_json(
-                    token_url, video_id, f'Downloading signed {format_id} manifest URL',
-                    fatal=False, query={
-                        'format': 'json',
-                        'url': video_url,
-                    }), ('url', {url_or_none}))
-                if tokenized_url:
-                    video_url = tokenized_url
-
-            ext = determine_ext(video_url)
-            if ext == 'f4m':
-                formats.extend(self._extract_f4m_formats(
-                    video_url, video_id, f4m_id=format_id, fatal=False))
-            elif ext == 'm3u8':
-                fmts, subs = self._extract_m3u8_formats_and_subtitles(
-                    video_url, video_id, 'mp4',
-                    entry_protocol='m3u8_native', m3u8_id=format_id,
-                    fatal=False)
-                formats.extend(fmts)
-                self._merge_subtitles(subs, target=subtitles)
-            elif ext == 'mpd':
-                fmts, subs = self._extract_mpd_formats_and_subtitles(
-                    video_url, video_id, mpd_id=format_id, fatal=False)
-                formats.extend(fmts)
-                self._merge_subtitles(subs, target=subtitles)
-            elif video_url.startswith('rtmp'):
+                return token_url, video['url']
+
+        # The same manifest is often served to both devices; only sign each one once
+        to_sign = {}
+        for video in videos:
+            if key := token_key(video):
+                to_sign.setdefault(key, video.get('format'))
+        token_cache = {key: self._sign_video_url(video_id, format_id, *key) for key, format_id in to_sign.items()}
+
+        formats, all_subs, video_url = [], [], None
+        for video in videos:
+            format_id = video.get('format')
+            video_url = token_cache.get(token_key(video)) or video['url']
+
+            if video_url.startswith('rtmp'):
                 formats.append({
                     'url': video_url,
                     'format_id': 'rtmp-%s' % format_id,
                     'ext': 'flv',
                 })
-            else:
-                if self._is_valid_url(video_url, video_id, format_id):
-                    formats.append({
-                        'url': video_url,
-                        'format_id': format_id,
-                    })
+            elif extract_manifest := self._manifest_extractors.get(determine_ext(video_url)):
+                fmts, subs = extract_manifest(video_url, video_id, format_id)
+                formats.extend(fmts)
+                all_subs.append(subs)
+            elif self._is_valid_url(video_url, video_id, format_id):
+                formats.append({
+                    'url': video_url,
+                    'format_id': format_id,
+                })
 
             # XXX: what is video['captions']?
 
@@ -192,9 +241,10 @@ def _extract_video(self, video_id, catalogue=None, hostname=None):
                 self.raise_geo_restricted(countries=self._GEO_COUNTRIES, metadata_available=True)
 
         for f in formats:
-            if f.get('acodec') != 'none' and f.get('language') in ('qtz', 'qad'):
+            if f.get('language') in _AUDIO_DESCRIPTION_LANGS and f.get('acodec') != 'none':
+                note = f.get('format_note')
+                f['format_note'] = f'audio description, {note}' if note else 'audio description'
                 f['language_preference'] = -10
-                f['format_note'] = 'audio description%s' % format_field(f, 'format_note', ', %s')
 
         if spritesheets:
             formats.append({
@@ -205,13 +255,7 @@ def _extract_video(self, video_id, catalogue=None, hostname=None):
                 'ext': 'mhtml',
                 'protocol': 'mhtml',
                 'url': 'about:invalid',
-                'fragments': [{
-                    'url': sheet,
-                    # XXX: not entirely accurate; each spritesheet seems to be
-                    # a 10×10 grid of thumbnails corresponding to approximately
-                    # 2 seconds of the video; the last spritesheet may be shorter
-                    'duration': 200,
-                } for sheet in spritesheets]
+                'fragments': [{'url': sheet, 'duration': _SHEET_DURATION} for sheet in spritesheets],
             })
 
         return {
@@ -222,7 +266,7 @@ def _extract_video(self, video_id, catalogue=None, hostname=None):
             'timestamp': timestamp,
             'is_live': is_live,
             'formats': formats,
-            'subtitles': subtitles,
+            'subtitles': self._merge_subtitles(*all_subs),
             'episode': subtitle if episode_number else None,
             'series': title if episode_number else None,
             'episode_number': int_or_none(episode_number),
@@ -323,14 +367,12 @@ def _real_extract(self, url):
         webpage = self._download_webpage(url, display_id)
 
         catalogue = None
-        video_id = self._search_regex(
-            r'(?:data-main-video\s*=|videoId["\']?\s*[:=])\s*(["\'])(?P<id>(?:(?!\1).)+)\1',
-            webpage, 'video id', default=None, group='id')
+        mobj = _SITE_VIDEO_ID_RE.search(webpage)
+        video_id = mobj.group('id') if mobj else None
 
         if not video_id:
             video_id, catalogue = self._html_search_regex(
-                r'(?:href=|player\.setVideo\(\s*)"http://videos?\.francetv\.fr/video/([^@]+@[^"]+)"',
-                webpage, 'video ID').split('@')
+                _SITE_VIDEO_URL_RE, webpage, 'video ID').split('@')
 
         return self._make_url_result(video_id, catalogue, url=url)
 
@@ -410,17 +452,18 @@ def _real_extract(self, url):
 
         webpage = self._download_webpage(url, display_id)
 
-        dailymotion_urls = tuple(DailymotionIE._extract_embed_urls(url, webpage))
+        # Every Dailymotion embed pattern needs one of these literals to match
+        if 'dailymotion' in webpage or 'DM.player' in webpage:
+            dailymotion_urls = tuple(DailymotionIE._extract_embed_urls(url, webpage))
+        else:
+            dailymotion_urls = ()
         if dailymotion_urls:
             return self.playlist_result([
                 self.url_result(dailymotion_url, DailymotionIE.ie_key())
                 for dailymotion_url in dailymotion_urls])
 
-        video_id = self._search_regex(
-            (r'player\.load[^;]+src:\s*["\']([^"\']+)',
-             r'id-video=([^@]+@[^"]+)',
-             r'<a[^>]+href="(?:https?:)?//videos\.francetv\.fr/video/([^@]+@[^"]+)"',
-             r'(?:data-id|<figure[^<]+\bid)=["\']([\da-f]{8}-[\da-f]{4}-[\da-f]{4}-[\da-f]{4}-[\da-f]{12})'),
-            webpage, 'video id')
+        video_id = self._search_regex([
+            regex for anchor, regex in _INFO_VIDEO_ID_RES
+            if anchor is None or anchor in webpage], webpage, 'video id')
 
         return self._make_url_result(video_id, url=url)